@@ -1,152 +1,610 @@
 #!/usr/bin/env python3
 import sys
 import subprocess
-import importlib.util
-
-# Check if required packages are installed
-def check_package(package_name):
-    spec = importlib.util.find_spec(package_name)
-    if spec is None:
-        print(f"Package {package_name} not found. Installing...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
-            print(f"Successfully installed {package_name}")
-            return True
-        except subprocess.CalledProcessError:
-            print(f"Failed to install {package_name}")
-            return False
-    return True
-
-# Check for required packages
-required_packages = ["tqdm"]
-for package in required_packages:
-    if not check_package(package):
-        sys.exit(1)
-
+import importlib
 import argparse
 import os
+import queue
 import threading
-import time
-from concurrent.futures import ThreadPoolExecutor
-from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
+import itertools
+
+# Check if a package is installed
+def is_package_installed(module_name):
+    try:
+        importlib.import_module(module_name)
+        return True
+    except ImportError:
+        return False
+
+# Install all missing packages with a single pip call
+def check_packages(packages):
+    missing = [package for module, package in packages.items() if not is_package_installed(module)]
+    if not missing:
+        return True
+
+    print(f"Packages {', '.join(missing)} not found. Installing...")
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--no-input",
+            "--disable-pip-version-check",
+            "--prefer-binary",  # Use wheels instead of building from source
+            *missing
+        ])
+        print(f"Successfully installed {', '.join(missing)}")
+        return True
+    except subprocess.CalledProcessError:
+        print(f"Failed to install {', '.join(missing)}")
+        return False
+
+# Required packages (module name -> pip package name)
+required_packages = {
+    "tqdm": "tqdm",
+    "google.cloud.storage": "google-cloud-storage",
+    # Compiled CRC32C for the storage client's hash validation. gsutil and gcloud storage run
+    # under the Cloud SDK's own Python, so this doesn't affect them.
+    "google_crc32c": "google-crc32c",
+}
+
+# Third-party names, imported by _ensure_deps() so that --help and argument errors stay fast
+tqdm = None
+Client = transfer_manager = None
+GoogleAPIError = GoogleAuthError = AuthRequest = HTTPAdapter = None
+# Optional asyncio client for batches of many small files
+aiohttp = Storage = None
+
+def _ensure_deps():
+    """Install any missing required packages and import the third-party modules."""
+    global tqdm, Client, transfer_manager, GoogleAPIError, GoogleAuthError, AuthRequest
+    global HTTPAdapter
+    global aiohttp, Storage
+    if not check_packages(required_packages):
+        sys.exit(1)
+
+    tqdm = importlib.import_module("tqdm").tqdm
+    GoogleAPIError = importlib.import_module("google.api_core.exceptions").GoogleAPIError
+    GoogleAuthError = importlib.import_module("google.auth.exceptions").GoogleAuthError
+    AuthRequest = importlib.import_module("google.auth.transport.requests").Request
+    HTTPAdapter = importlib.import_module("requests.adapters").HTTPAdapter
+    Client = importlib.import_module("google.cloud.storage").Client
+    transfer_manager = importlib.import_module("google.cloud.storage.transfer_manager")
+
+    try:
+        aiohttp = importlib.import_module("aiohttp")
+        Storage = importlib.import_module("gcloud.aio.storage").Storage
+    except ImportError:
+        Storage = None
+
+# Bound once to skip the os.path attribute lookups in per-item loops
+_basename = os.path.basename
+_join = os.path.join
 
 # Maximum number of parallel downloads
 MAX_PARALLEL_DOWNLOADS = 16
 # Maximum number of threads for a single download
 MAX_THREADS_PER_DOWNLOAD = 8
-
-def get_size_of_object(bucket_path):
+# Number of gsutil processes for a single download, so hashing can run on other cores.
+# gsutil's multiprocessing hangs on macOS and Windows, so only threads are used there.
+MAX_PROCESSES_PER_DOWNLOAD = 1 if sys.platform in ("darwin", "win32") else min(os.cpu_count() or 4, 8)
+# gsutil check_hashes policy; "never" skips validation for trusted downloads
+CHECK_HASHES = "if_fast_else_skip"
+# Sliced downloads are split into chunks of this size
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+# Objects smaller than this are never sliced; larger ones get a slice per this many bytes
+SLICED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+# The same threshold in the size format gsutil and gcloud storage read
+_SLICED_THRESHOLD_SETTING = f"{SLICED_DOWNLOAD_THRESHOLD // (1024 * 1024)}M"
+# Batches where every file is smaller than this are downloaded with asyncio
+SMALL_FILE_SIZE = 8 * 1024 * 1024
+
+# Copy commands, the first item being the executable and the rest the cp subcommand and flags
+GCLOUD_CP_CMD = ["gcloud", "storage", "cp", "--recursive", "--no-clobber", "--do-not-decompress"]
+GSUTIL_CP_CMD = ["gsutil", "cp", "-r", "-n"]  # Recursive, skip files that already exist
+# Copy command used when downloading without the storage client
+CP_CMD = GSUTIL_CP_CMD
+# Environment for every gsutil/gcloud process: skip usage reporting and log file writes,
+# which each invocation would otherwise pay for at start-up
+_GSUTIL_ENV = {
+    **os.environ,
+    "CLOUDSDK_CORE_DISABLE_USAGE_REPORTING": "True",
+    "CLOUDSDK_CORE_DISABLE_FILE_LOGGING": "True",
+}
+# gsutil options that don't depend on the command line, passed per invocation instead of
+# being written to ~/.boto
+_GSUTIL_OPTS = [
+    "-o", f"GSUtil:sliced_object_download_threshold={_SLICED_THRESHOLD_SETTING}",
+    "-o", "GSUtil:use_magicfile=False",
+]
+
+# Matches a `gsutil ls -l` line: "<size>  <timestamp>  gs://path", or just "gs://path/" for folders
+_LS_LINE = re.compile(rb'^\s*(?:(\d+)\s+\S+\s+)?(gs://.+?)\s*$')
+# Matches the bytes transferred so far in a progress line from
+# gsutil ("[1/3 files][ 12.5 MiB/ 40.0 MiB]") or gcloud storage ("Completed files 1/3 | 12.5MiB/40.0MiB",
+# or "Completed files 1 | 12.5MiB | 3.0MiB/s" before it has a total), never the throughput field
+_PROGRESS_LINE = re.compile(
+    r'(?:\]\[\s*([\d.]+)\s*([KMGTP]i?B|B)\s*/|^\s*Completed files \S+ \| ([\d.]+)\s*([KMGTP]i?B|B)\b)',
+    re.IGNORECASE
+)
+_SIZE_UNITS = {
+    "b": 1,
+    "kib": 1024, "mib": 1024 ** 2, "gib": 1024 ** 3, "tib": 1024 ** 4, "pib": 1024 ** 5,
+    "kb": 1000, "mb": 1000 ** 2, "gb": 1000 ** 3, "tb": 1000 ** 4, "pb": 1000 ** 5,
+}
+# Matches error lines in gsutil or gcloud storage output
+_ERROR_LINE = re.compile(r'^(ERROR|\w+Exception)\b')
+# Matches the gs:// URLs named in an error line
+_GCS_URL = re.compile(r'gs://\S+')
+# Number of bucket entries shown at a time in interactive mode
+LISTING_PAGE_SIZE = 1000
+# Bucket listings already fetched this session, keyed by bucket path
+_listing_cache = {}
+
+def create_storage_client():
+    """Create a google-cloud-storage client, or return None if no credentials are available."""
+    global MAX_PARALLEL_DOWNLOADS, MAX_THREADS_PER_DOWNLOAD
+    try:
+        # Downloads don't need a project, so don't fail when none is configured
+        client = Client(project=None)
+        # Creating the client doesn't contact the auth server, so check for expired or revoked
+        # credentials now, while gsutil can still be used instead
+        client._credentials.refresh(AuthRequest())
+    except (GoogleAuthError, OSError) as e:
+        print(f"Note: Could not create storage client: {e}")
+        print("Falling back to gsutil. Run 'gcloud auth application-default login' to use the native client.")
+        return None
+
+    # Every download thread shares this session; the default pool of 10 connections would
+    # make the rest reconnect for each request
+    adapter = HTTPAdapter(pool_maxsize=MAX_PARALLEL_DOWNLOADS * MAX_THREADS_PER_DOWNLOAD)
+    client._http.mount("https://", adapter)
+    print("Using google-cloud-storage client")
+    return client
+
+def split_gcs_path(bucket_path):
+    """Split a gs://bucket/prefix path into (bucket_name, prefix)."""
+    bucket_name, _, prefix = bucket_path[len("gs://"):].partition("/")
+    return bucket_name, prefix
+
+def list_folder_blobs(bucket_path, client):
+    """List every object under a gs:// folder path with the storage client.
+
+    Returns (prefix, blobs), where prefix is the folder prefix the blob names start with.
+    """
+    bucket_name, prefix = split_gcs_path(bucket_path)
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+    blobs = [blob for blob in client.list_blobs(bucket_name, prefix=prefix) if not blob.name.endswith("/")]
+    return prefix, blobs
+
+def find_objects(bucket_path, client):
+    """Look up a single object or a folder with the storage client.
+
+    Returns (size, folder), where folder is None for a single object and the
+    list_folder_blobs() result otherwise, so a folder is only listed once.
+    """
+    bucket_name, prefix = split_gcs_path(bucket_path)
+    if prefix and not prefix.endswith("/"):
+        blob = client.bucket(bucket_name).get_blob(prefix)
+        if blob is not None:
+            return blob.size, None
+    folder = list_folder_blobs(bucket_path, client)
+    return sum(blob.size for blob in folder[1]), folder
+
+def get_size_of_object(bucket_path, client=None):
     """Get the size of a single object or total size of objects in a directory in GCS."""
+    if client is not None:
+        try:
+            return find_objects(bucket_path, client)[0]
+        except (GoogleAPIError, GoogleAuthError):
+            return 0
+
     try:
         # Use gsutil du to get the size
         result = subprocess.run(
             ["gsutil", "-q", "du", "-s", bucket_path],
             capture_output=True,
-            text=True,
+            env=_GSUTIL_ENV,
             check=True
         )
-        # Extract the size from the output (first value)
-        size_str = result.stdout.strip().split()[0]
-        return int(size_str)
-    except subprocess.CalledProcessError:
+        # Extract the size from the output (first value), without splitting the whole line
+        return int(result.stdout.lstrip().partition(b' ')[0])
+    except (subprocess.CalledProcessError, ValueError):
         return 0
 
-def list_objects(bucket_path):
-    """List all objects in a bucket or bucket path."""
-    try:
-        result = subprocess.run(
-            ["gsutil", "ls", bucket_path],
-            capture_output=True,
-            text=True,
-            check=True
+def list_objects_with_meta(bucket_path, client=None):
+    """Yield (path, size) pairs for all objects in a bucket or bucket path as they are listed.
+
+    Folders have a size of None. Complete listings are cached per bucket path for the session.
+    """
+    if bucket_path in _listing_cache:
+        yield from _listing_cache[bucket_path]
+        return
+
+    items = []
+    if client is not None:
+        bucket_name, prefix = split_gcs_path(bucket_path)
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        # Use a delimiter so folders show up as prefixes, like gsutil ls
+        try:
+            blobs = client.list_blobs(bucket_name, prefix=prefix, delimiter="/")
+            for page in blobs.pages:
+                for blob in page:
+                    if blob.name != prefix:
+                        item = (f"gs://{bucket_name}/{blob.name}", blob.size)
+                        items.append(item)
+                        yield item
+                for folder in page.prefixes:
+                    item = (f"gs://{bucket_name}/{folder}", None)
+                    items.append(item)
+                    yield item
+        except (GoogleAPIError, GoogleAuthError) as e:
+            print(f"Error listing objects: {e}")
+            return
+    else:
+        # ls -l returns names and sizes in a single call; read it as it is produced
+        process = subprocess.Popen(
+            ["gsutil", "ls", "-l", bucket_path],
+            stdout=subprocess.PIPE,
+            env=_GSUTIL_ENV,
+            bufsize=1 << 20
         )
-        items = result.stdout.strip().split('\n')
-        return [item for item in items if item]  # Filter out empty strings
-    except subprocess.CalledProcessError as e:
-        print(f"Error listing objects: {e}")
-        return []
+        finished = False
+        try:
+            # Parse the raw bytes and only decode the matched paths
+            for line in process.stdout:
+                match = _LS_LINE.match(line)
+                if match:  # Skips empty lines and the TOTAL summary
+                    size, path = match.groups()
+                    item = (path.decode(), int(size) if size is not None else None)
+                    items.append(item)
+                    yield item
+            finished = True
+        finally:
+            # Stop gsutil if the caller stopped reading before the end of the listing
+            if not finished:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+        if process.returncode != 0:
+            print(f"Error listing objects: gsutil exited with status {process.returncode}")
+            return
+
+    _listing_cache[bucket_path] = items
+
+def download_blob(blob, destination, size=None):
+    """Download a single blob to a local file path.
+
+    size is the blob's listed size, for blobs created without fetching their metadata.
+    """
+    global MAX_THREADS_PER_DOWNLOAD, DOWNLOAD_CHUNK_SIZE, CHECK_HASHES
+    verify = CHECK_HASHES != "never"
+    # Skip files that already exist, like gsutil cp -n
+    if os.path.isfile(destination):
+        return
+    parent_dir = os.path.dirname(destination)
+    if parent_dir:
+        os.makedirs(parent_dir, exist_ok=True)
+    # Download to a temporary name, so a failed download never leaves a file that the
+    # existence check above would skip on the next run
+    part_path = destination + ".part"
+    components = pick_components(blob.size if size is None else size)
+    try:
+        if components > 1:
+            # Sliced download of a large object over the shared client session
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                part_path,
+                chunk_size=DOWNLOAD_CHUNK_SIZE,
+                max_workers=min(components, MAX_THREADS_PER_DOWNLOAD),
+                worker_type=transfer_manager.THREAD,
+                crc32c_checksum=verify
+            )
+        else:
+            blob.download_to_filename(part_path, checksum="auto" if verify else None)
+        os.replace(part_path, destination)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+def download_objects(source, destination, client, on_progress, size=None, folder=None):
+    """Download a single object or every object under a prefix with the storage client.
+
+    on_progress is called with the size of each object once it has been downloaded.
+    size is the listed size of a single object and folder a list_folder_blobs() result,
+    if already known, which saves looking the source up again.
+    """
+    global MAX_PARALLEL_DOWNLOADS
+    bucket_name, prefix = split_gcs_path(source)
+    try:
+        if folder is None and prefix and not prefix.endswith("/"):
+            bucket = client.bucket(bucket_name)
+            # An object with a listed size needs no metadata request before its download
+            blob = bucket.blob(prefix) if size is not None else bucket.get_blob(prefix)
+            if blob is not None:
+                # Copy into an existing directory under the object's name, like gsutil cp
+                if os.path.isdir(destination):
+                    destination = _join(destination, _basename(prefix))
+                download_blob(blob, destination, size)
+                on_progress(blob.size if size is None else size)
+                return True
+
+        # Otherwise treat the source as a folder and download everything under it
+        prefix, blobs = folder if folder is not None else list_folder_blobs(source, client)
+    except Exception as e:
+        print(f"Error downloading {source}: {e}")
+        return False
+
+    # Neither an object nor a non-empty folder, which gsutil also reports as an error
+    if not blobs:
+        print(f"Error downloading {source}: No URLs matched")
+        return False
+
+    success = True
+    join, realpath = _join, os.path.realpath
+    prefix_len = len(prefix)
+    # Object names like "../x" or "/etc/x" would otherwise resolve outside the destination
+    root = os.path.join(realpath(destination), "")
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+        futures = {}
+        for blob in blobs:
+            file_dest = realpath(join(destination, blob.name[prefix_len:]))
+            if not file_dest.startswith(root):
+                print(f"Skipping gs://{bucket_name}/{blob.name}: resolves outside {destination}")
+                continue
+            futures[executor.submit(download_blob, blob, file_dest)] = blob
+        # Count each object as it finishes instead of polling the destination
+        for future in as_completed(futures):
+            blob = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error downloading gs://{bucket_name}/{blob.name}: {e}")
+                success = False
+            on_progress(blob.size)
+
+    return success
 
-def download_with_progress(source, destination, total_size=None):
+def download_with_progress(source, destination, total_size=None, client=None):
     """Download files with optimized performance and progress bar."""
-    global MAX_THREADS_PER_DOWNLOAD
     # If total_size is not provided, try to get it
-    if total_size is None:
+    folder = None
+    if total_size is None and client is not None:
+        # Look the source up once, for both the progress bar and the download
+        try:
+            total_size, folder = find_objects(source, client)
+        except (GoogleAPIError, GoogleAuthError):
+            pass  # download_objects() looks it up again and reports the error
+    elif total_size is None:
         total_size = get_size_of_object(source)
 
     # Create progress bar
     progress_bar = tqdm(total=total_size, unit='B', unit_scale=True, desc=f"Downloading {os.path.basename(source)}")
 
-    # Flag to signal download completion
-    download_complete = threading.Event()
+    # Download in-process with the storage client when available
+    if client is not None:
+        success = download_objects(source, destination, client, progress_bar.update,
+                                   size=total_size, folder=folder)
+    else:
+        success = download_with_gsutil(source, destination, progress_bar.update, total_size)
 
-    # Monitor file size growth for progress updates
-    def update_progress():
-        previous_size = 0
-        while not download_complete.is_set():
-            try:
-                # For folders we need a different approach
-                if os.path.isdir(destination):
-                    current_size = sum(os.path.getsize(os.path.join(dirpath, filename))
-                                      for dirpath, _, filenames in os.walk(destination)
-                                      for filename in filenames)
-                else:
-                    current_size = os.path.getsize(destination) if os.path.exists(destination) else 0
+    # Close progress bar
+    progress_bar.close()
 
-                # Update progress bar with the difference
-                if current_size > previous_size:
-                    progress_bar.update(current_size - previous_size)
-                    previous_size = current_size
+    return success
 
-                # Prevent CPU overuse
-                time.sleep(0.1)
+def pick_components(size):
+    """Pick how many concurrent slices to download an object of size bytes in.
 
-            except OSError:
-                # File might be being written to or not exist yet
-                time.sleep(0.1)
+    Small objects are not sliced, since per-slice setup costs more than it saves.
+    """
+    if size < SLICED_DOWNLOAD_THRESHOLD:
+        return 1
+    return min(os.cpu_count() or 4, max(2, size // SLICED_DOWNLOAD_THRESHOLD), 32)
 
-    # Start progress monitoring in a separate thread
-    progress_thread = threading.Thread(target=update_progress)
-    progress_thread.daemon = True
-    progress_thread.start()
+def cp_command(total_size=None):
+    """Build the copy command argv prefix and environment for a download of total_size bytes.
 
+    total_size is None when the size is unknown.
+    """
+    global MAX_THREADS_PER_DOWNLOAD, MAX_PROCESSES_PER_DOWNLOAD, DOWNLOAD_CHUNK_SIZE
+    if total_size is None:
+        max_components = MAX_THREADS_PER_DOWNLOAD
+    else:
+        max_components = pick_components(total_size)
+    component_size = f"{DOWNLOAD_CHUNK_SIZE // (1024 * 1024)}M"
+
+    if CP_CMD[0] == "gcloud":
+        # gcloud storage reads its tuning from CLOUDSDK_STORAGE_* properties
+        env = {
+            **_GSUTIL_ENV,
+            "CLOUDSDK_STORAGE_THREAD_COUNT": str(MAX_THREADS_PER_DOWNLOAD),
+            "CLOUDSDK_STORAGE_PROCESS_COUNT": str(MAX_PROCESSES_PER_DOWNLOAD),
+            "CLOUDSDK_STORAGE_CHECK_HASHES": CHECK_HASHES,
+            "CLOUDSDK_STORAGE_SLICED_OBJECT_DOWNLOAD_THRESHOLD": _SLICED_THRESHOLD_SETTING,
+            "CLOUDSDK_STORAGE_SLICED_OBJECT_DOWNLOAD_COMPONENT_SIZE": component_size,
+            "CLOUDSDK_STORAGE_SLICED_OBJECT_DOWNLOAD_MAX_COMPONENTS": str(max_components),
+        }
+        return CP_CMD, env
+
+    # Use -m for parallel composite uploads and downloads
+    # Use -o for setting options to optimize performance
+    options = [
+        "-m",
+        *_GSUTIL_OPTS,
+        "-o", f"GSUtil:parallel_thread_count={MAX_THREADS_PER_DOWNLOAD}",
+        "-o", f"GSUtil:parallel_process_count={MAX_PROCESSES_PER_DOWNLOAD}",
+        "-o", f"GSUtil:sliced_object_download_component_size={component_size}",
+        "-o", f"GSUtil:sliced_object_download_max_components={max_components}",
+        # Validate when gsutil has a compiled CRC32C library, skip instead of using slow pure-Python CRC32C
+        "-o", f"GSUtil:check_hashes={CHECK_HASHES}",
+    ]
+    return [CP_CMD[0], *options, *CP_CMD[1:]], _GSUTIL_ENV
+
+def download_with_gsutil(source, destination, on_progress, total_size=0):
+    """Download files by shelling out to gcloud storage or gsutil.
+
+    on_progress is called with the number of new bytes each time the copy command reports progress.
+    """
     # Start download process with optimized parameters
-    try:
-        # Use -m for parallel composite uploads and downloads
-        # Use -o for setting options to optimize performance
-        process = subprocess.run(
-            [
-                "gsutil",
-                "-m",
-                "-o", f"GSUtil:parallel_thread_count={MAX_THREADS_PER_DOWNLOAD}",
-                "-o", "GSUtil:parallel_process_count=1",  # Use threading instead of processes
-                "-o", "GSUtil:sliced_object_download_threshold=64M",
-                "-o", "GSUtil:sliced_object_download_max_components=8",
-                "cp",
-                "-r",  # Recursive
-                "-n",  # Skip files that already exist
-                source,
-                destination
-            ],
-            check=True
-        )
-        success = True
-    except subprocess.CalledProcessError:
-        success = False
-
-    # Signal download completion
-    download_complete.set()
-
-    # Wait for progress thread to finish updates
-    progress_thread.join(timeout=1.0)
-
-    # Close progress bar
-    progress_bar.close()
-
-    return success
+    command, env = cp_command(total_size)
+    process = subprocess.Popen(
+        [
+            *command,
+            source,
+            destination
+        ],
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True
+    )
+
+    # Follow the copy command's own progress output instead of polling the destination.
+    # Universal newlines also split its carriage-return progress updates.
+    transferred = 0
+    for line in process.stderr:
+        match = _PROGRESS_LINE.search(line)
+        if match:
+            amount, unit = match.group(1, 2) if match.group(1) else match.group(3, 4)
+            current = int(float(amount) * _SIZE_UNITS[unit.lower()])
+            if current > transferred:
+                on_progress(current - transferred)
+                transferred = current
+        elif _ERROR_LINE.match(line.strip()):
+            tqdm.write(line.strip(), file=sys.stderr)
+
+    process.wait()
+    return process.returncode == 0
+
+async def async_batch_download(items, destination, on_done):
+    """Download many small (path, size) files concurrently over one shared HTTP session.
+
+    on_done is called once for every file that finishes. Returns (path, success) pairs.
+    """
+    global MAX_PARALLEL_DOWNLOADS
+    import asyncio
+    # Thousands of downloads can be queued, but only this many are in flight at once
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_DOWNLOADS * 4)
+    basename, join = _basename, _join
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=64)) as session:
+        storage = Storage(session=session)
+
+        async def download_item(item):
+            bucket_name, object_name = split_gcs_path(item)
+            file_dest = join(destination, basename(item))
+            success = True
+            async with semaphore:
+                # Skip files that already exist, like gsutil cp -n
+                if not os.path.exists(file_dest):
+                    # Download to a temporary name, so a failed download is never skipped later
+                    part_path = file_dest + ".part"
+                    try:
+                        await storage.download_to_filename(bucket_name, object_name, part_path)
+                        os.replace(part_path, file_dest)
+                    except Exception as e:
+                        tqdm.write(f"Error downloading {item}: {e}", file=sys.stderr)
+                        success = False
+                        try:
+                            os.remove(part_path)
+                        except OSError:
+                            pass
+            on_done()
+            return item, success
+
+        return await asyncio.gather(*(download_item(item) for item, _ in items))
+
+class GsutilPool:
+    """Long-lived copy processes that read source URLs from stdin, one per destination directory.
+
+    Reusing one process for every item of a batch saves a gsutil start-up per item.
+    on_copy is called once for every object the copy command starts or skips.
+    total_size is the size of the largest object to be queued, if known, for slice tuning.
+    """
+
+    def __init__(self, on_copy=None, total_size=None):
+        self.on_copy = on_copy
+        self.total_size = total_size
+        self.processes = {}
+        self.readers = {}
+        # URLs named in the copy commands' error output
+        self.failed = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def enqueue(self, source, destination):
+        """Queue a download of source into the destination directory."""
+        process = self.processes.get(destination)
+        if process is None:
+            command, env = cp_command(self.total_size)
+            process = subprocess.Popen(
+                [
+                    *command,
+                    "-I",  # Read source URLs from stdin
+                    destination
+                ],
+                stdin=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+                text=True,
+                bufsize=1  # Line buffered, so each URL is sent as soon as it is queued
+            )
+            reader = threading.Thread(target=self._read_stderr, args=(process,))
+            reader.daemon = True
+            reader.start()
+            self.processes[destination] = process
+            self.readers[destination] = reader
 
-def batch_download(items, destination, is_folders=False, max_workers=None):
-    """Download multiple items in parallel batches."""
+        try:
+            process.stdin.write(f"{source}\n")
+        except BrokenPipeError:
+            # The process already exited; wait() reports the failure
+            pass
+
+    def _read_stderr(self, process):
+        # Universal newlines also split gsutil's carriage-return progress updates
+        for line in process.stderr:
+            line = line.strip()
+            if line.startswith(("Copying ", "Skipping existing")):
+                if self.on_copy is not None:
+                    self.on_copy()
+            elif _ERROR_LINE.match(line):
+                tqdm.write(line, file=sys.stderr)
+                self.failed.update(url.strip("'\",") for url in _GCS_URL.findall(line))
+            elif line.startswith("-gs://"):
+                # gcloud storage lists the URLs that matched nothing on their own lines
+                tqdm.write(line, file=sys.stderr)
+                self.failed.add(line[1:])
+
+    def wait(self, destination):
+        """Finish the queue for destination and wait for its downloads to complete."""
+        process = self.processes.pop(destination, None)
+        if process is None:
+            return True
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
+        self.readers.pop(destination).join()
+        return process.returncode == 0
+
+    def close(self):
+        """Wait for every queued download to complete."""
+        results = [self.wait(destination) for destination in list(self.processes)]
+        return all(results)
+
+def batch_download(items, destination, is_folders=False, max_workers=None, client=None):
+    """Download multiple (path, size) items in parallel batches."""
     global MAX_PARALLEL_DOWNLOADS
     if max_workers is None:
         max_workers = MAX_PARALLEL_DOWNLOADS
@@ -154,26 +612,91 @@ def batch_download(items, destination, is_folders=False, max_workers=None):
     total_items = len(items)
     print(f"Starting download of {total_items} {'folders' if is_folders else 'files'} in parallel")
 
-    # Function to download a single item
-    def download_item(item):
-        if is_folders:
-            # Create destination folder
-            folder_name = os.path.basename(item.rstrip('/'))
-            folder_dest = os.path.join(destination, folder_name)
-            if not os.path.exists(folder_dest):
-                os.makedirs(folder_dest)
-            success = download_with_progress(item, folder_dest)
-        else:
-            # Download single file
-            file_name = os.path.basename(item)
-            file_dest = os.path.join(destination, file_name)
-            success = download_with_progress(item, file_dest)
+    # Create the common parent once, so workers don't race to create it
+    os.makedirs(destination, exist_ok=True)
 
-        return item, success
+    # Storage client workers push downloaded byte counts here; one consumer thread owns the progress bar
+    progress_q = queue.SimpleQueue()
 
-    # Use ThreadPoolExecutor to download in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results = list(executor.map(download_item, items))
+    # Function to download a single item with the storage client.
+    # Loop-invariant names are bound as defaults so each call reads them as fast locals.
+    def download_item(item, size, folder, is_folders=is_folders, destination=destination, client=client,
+                      on_progress=progress_q.put, basename=_basename, join=_join):
+        if is_folders:
+            # Create destination folder
+            folder_name = basename(item.rstrip('/'))
+            folder_dest = join(destination, folder_name)
+            os.makedirs(folder_dest, exist_ok=True)
+            return download_objects(item, folder_dest, client, on_progress, size=size, folder=folder)
+
+        # Download single file, with the size from the listing
+        file_name = basename(item)
+        file_dest = join(destination, file_name)
+        return download_objects(item, file_dest, client, on_progress, size=size)
+
+    # Function to list an item that was listed without a size (folders) once,
+    # for both its total size and its download. Returns (item, size, folder).
+    def list_item(entry):
+        item, size = entry
+        if size is not None:
+            return item, size, None
+        try:
+            folder = list_folder_blobs(item, client)
+        except (GoogleAPIError, GoogleAuthError):
+            return item, 0, None  # download_objects() lists it again and reports the error
+        return item, sum(blob.size for blob in folder[1]), folder
+
+    # Update the progress bar until the None terminator arrives; blocks instead of polling
+    def consume_progress(progress_bar):
+        while (n_bytes := progress_q.get()) is not None:
+            progress_bar.update(n_bytes)
+
+    results = []
+    if (client is not None and Storage is not None and not is_folders and CHECK_HASHES == "never"
+            and all(size is not None and size < SMALL_FILE_SIZE for _, size in items)):
+        # Small files are latency-bound, so run them all as coroutines on one connection pool.
+        # gcloud-aio-storage doesn't validate hashes, so this is only used when checks are skipped.
+        # Imported here so that start-up doesn't pay for asyncio unless this path is taken
+        import asyncio
+        with tqdm(total=total_items, unit='file', desc="Overall progress") as progress_bar:
+            results = asyncio.run(async_batch_download(items, destination, lambda: progress_bar.update(1)))
+    elif client is None:
+        # Stream every item into one long-lived copy process instead of starting one per item.
+        # Size slicing by the largest file, so batches of small files are not sliced at all.
+        largest_size = None if is_folders else max(size or 0 for _, size in items)
+        with tqdm(total=None if is_folders else total_items, unit='file', desc="Overall progress") as progress_bar, \
+                GsutilPool(on_copy=lambda: progress_bar.update(1), total_size=largest_size) as pool:
+            for item, _ in items:
+                pool.enqueue(item, destination)
+            success = pool.wait(destination)
+
+        # Every item shares one process, so only the URLs named in its errors are known to have failed
+        def item_failed(item):
+            if item.endswith("/"):
+                return any(url.startswith(item) for url in pool.failed)
+            return item in pool.failed
+
+        results = [(item, not item_failed(item)) for item, _ in items]
+        if not success and all(ok for _, ok in results):
+            print(f"Failed to download some items into {destination}; see the errors above")
+            return
+    else:
+        # Use ThreadPoolExecutor to download in parallel, handling items as they finish
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            listed = list(executor.map(list_item, items))
+            total_size = sum(size for _, size, _ in listed)
+            with tqdm(total=total_size, unit='B', unit_scale=True, desc="Overall progress") as progress_bar:
+                progress_thread = threading.Thread(target=consume_progress, args=(progress_bar,))
+                progress_thread.daemon = True
+                progress_thread.start()
+
+                futures = {executor.submit(download_item, *entry): entry[0] for entry in listed}
+                for future in as_completed(futures):
+                    results.append((futures[future], future.result()))
+
+                # Signal the consumer that every download has finished
+                progress_q.put(None)
+                progress_thread.join()
 
     # Print results
     successful = [item for item, success in results if success]
@@ -188,46 +711,28 @@ def batch_download(items, destination, is_folders=False, max_workers=None):
             print(f"  - {item}")
 
 def check_gsutil_installed():
-    """Check if gsutil is installed and available in PATH."""
+    """Check if gsutil is installed and available in PATH.
+
+    Also selects `gcloud storage cp` as the copy command when it is available.
+    """
+    global CP_CMD
     try:
-        result = subprocess.run(["gsutil", "version"], capture_output=True, check=True)
+        result = subprocess.run(["gsutil", "version"], capture_output=True, env=_GSUTIL_ENV, check=True)
         print(f"Using {result.stdout.decode().splitlines()[0].strip()}")
-        return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("Error: gsutil is not installed or not in your PATH.")
         print("Please install the Google Cloud SDK and ensure gsutil is working.")
         print("Installation guide: https://cloud.google.com/sdk/docs/install")
         return False
 
-def optimize_gsutil_config():
-    """Apply performance optimizations to gsutil config."""
-    global MAX_THREADS_PER_DOWNLOAD
-    print("Applying gsutil performance optimizations...")
+    # gcloud storage has a much faster transfer engine than gsutil
     try:
-        # Check if boto config exists and has parallelism settings
-        has_optimizations = False
-        boto_config = os.path.expanduser("~/.boto")
-        if os.path.exists(boto_config):
-            with open(boto_config, 'r') as f:
-                content = f.read()
-                if "parallel_thread_count" in content:
-                    has_optimizations = True
-
-        # If optimizations don't exist, add them
-        if not has_optimizations:
-            subprocess.run([
-                "gsutil",
-                "config",
-                "-o", f"GSUtil:parallel_thread_count={MAX_THREADS_PER_DOWNLOAD}",
-                "-o", "GSUtil:parallel_process_count=1",
-                "-o", "GSUtil:sliced_object_download_threshold=64M",
-                "-o", "GSUtil:sliced_object_download_max_components=8",
-                "-o", "GSUtil:use_magicfile=False"
-            ], check=True)
-            print("Applied performance optimizations to gsutil configuration")
-    except Exception as e:
-        print(f"Note: Could not optimize gsutil config: {e}")
-        print("Downloads will still work but might not be at peak performance")
+        subprocess.run(["gcloud", "storage", "--help"], capture_output=True, env=_GSUTIL_ENV, check=True)
+        CP_CMD = GCLOUD_CP_CMD
+        print("Using gcloud storage for downloads")
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        CP_CMD = GSUTIL_CP_CMD
+    return True
 
 def get_default_destination():
     """Get the default destination (Canva folder)."""
@@ -251,26 +756,25 @@ def prompt_for_destination():
     dest = os.path.expanduser(dest)
 
     # Create directory if it doesn't exist
-    if not os.path.exists(dest):
-        try:
-            os.makedirs(dest)
-            print(f"Created directory: {dest}")
-        except OSError as e:
-            print(f"Error creating directory {dest}: {e}")
-            return None
+    try:
+        os.makedirs(dest, exist_ok=True)
+    except OSError as e:
+        print(f"Error creating directory {dest}: {e}")
+        return None
 
     return dest
 
-def interactive_download():
+def interactive_download(client=None):
     """Interactive mode for downloading files/folders from GCS."""
     # Get bucket information
     bucket = input("Enter the GCS bucket name (e.g., gs://your-bucket): ")
     if not bucket.startswith("gs://"):
         bucket = f"gs://{bucket}"
 
-    # List the contents of the bucket
+    # List the contents of the bucket, a page at a time while the listing is still running
     print(f"Listing contents of {bucket}...")
-    items = list_objects(bucket)
+    listing = list_objects_with_meta(bucket, client)
+    items = list(itertools.islice(listing, LISTING_PAGE_SIZE))
 
     if not items:
         print("No items found in the bucket or bucket does not exist.")
@@ -278,8 +782,15 @@ def interactive_download():
 
     # Display bucket contents
     print("\nBucket contents:")
-    for i, item in enumerate(items, 1):
-        print(f"{i}. {item}")
+    page = items
+    while True:
+        for i, (item, _) in enumerate(page, len(items) - len(page) + 1):
+            print(f"{i}. {item}")
+        if len(page) < LISTING_PAGE_SIZE or input("Show more? [y/N]: ").strip().lower() != "y":
+            break
+        page = list(itertools.islice(listing, LISTING_PAGE_SIZE))
+        items.extend(page)
+    listing.close()
 
     # Ask user what they want to download
     print("\nWhat would you like to download?")
@@ -301,10 +812,10 @@ def interactive_download():
         # Single file
         file_index = int(input("Enter the number of the file to download: ")) - 1
         if 0 <= file_index < len(items):
-            file_path = items[file_index]
+            file_path, file_size = items[file_index]
             file_name = os.path.basename(file_path)
             file_dest = os.path.join(destination, file_name)
-            download_with_progress(file_path, file_dest)
+            download_with_progress(file_path, file_dest, total_size=file_size, client=client)
         else:
             print("Invalid file selection.")
 
@@ -315,7 +826,7 @@ def interactive_download():
             indices = [int(idx.strip()) - 1 for idx in indices.split(",")]
             files_to_download = [items[idx] for idx in indices if 0 <= idx < len(items)]
             if files_to_download:
-                batch_download(files_to_download, destination, is_folders=False)
+                batch_download(files_to_download, destination, is_folders=False, client=client)
             else:
                 print("No valid files selected.")
         except ValueError:
@@ -325,14 +836,13 @@ def interactive_download():
         # Single folder
         folder_index = int(input("Enter the number of the folder to download: ")) - 1
         if 0 <= folder_index < len(items):
-            folder_path = items[folder_index]
+            folder_path, _ = items[folder_index]
             folder_name = os.path.basename(folder_path.rstrip('/'))
             folder_dest = os.path.join(destination, folder_name)
 
-            if not os.path.exists(folder_dest):
-                os.makedirs(folder_dest)
+            os.makedirs(folder_dest, exist_ok=True)
 
-            download_with_progress(folder_path, folder_dest)
+            download_with_progress(folder_path, folder_dest, client=client)
         else:
             print("Invalid folder selection.")
 
@@ -343,7 +853,7 @@ def interactive_download():
             indices = [int(idx.strip()) - 1 for idx in indices.split(",")]
             folders_to_download = [items[idx] for idx in indices if 0 <= idx < len(items)]
             if folders_to_download:
-                batch_download(folders_to_download, destination, is_folders=True)
+                batch_download(folders_to_download, destination, is_folders=True, client=client)
             else:
                 print("No valid folders selected.")
         except ValueError:
@@ -353,13 +863,21 @@ def interactive_download():
         # Everything in bucket
         print(f"Downloading everything from {bucket} to {destination}")
         # For efficiency, download the entire bucket with a single command
-        download_with_progress(bucket, destination)
+        download_with_progress(bucket, destination, client=client)
 
     else:
         print("Invalid choice. Please run the program again and select a valid option.")
 
+def positive_int(value):
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def main():
-    global MAX_PARALLEL_DOWNLOADS, MAX_THREADS_PER_DOWNLOAD
+    global MAX_PARALLEL_DOWNLOADS, MAX_THREADS_PER_DOWNLOAD, MAX_PROCESSES_PER_DOWNLOAD, DOWNLOAD_CHUNK_SIZE
+    global CHECK_HASHES
     """Main function to run the GCS downloader CLI."""
     parser = argparse.ArgumentParser(description="High-performance download tool for Google Cloud Storage")
     parser.add_argument("--bucket", help="GCS bucket path (e.g., gs://your-bucket)")
@@ -371,6 +889,12 @@ def main():
                         help=f"Maximum number of parallel downloads (default: {MAX_PARALLEL_DOWNLOADS})")
     parser.add_argument("--threads", type=int, default=MAX_THREADS_PER_DOWNLOAD,
                         help=f"Number of threads per download (default: {MAX_THREADS_PER_DOWNLOAD})")
+    parser.add_argument("--processes", type=positive_int, default=MAX_PROCESSES_PER_DOWNLOAD,
+                        help=f"Number of gsutil processes per download (default: {MAX_PROCESSES_PER_DOWNLOAD})")
+    parser.add_argument("--skip-hash-check", action="store_true",
+                        help="Skip checksum validation of downloaded files (only for trusted sources)")
+    parser.add_argument("--chunk-size", type=positive_int, default=DOWNLOAD_CHUNK_SIZE // (1024 * 1024),
+                        help=f"Download slice size in MiB (default: {DOWNLOAD_CHUNK_SIZE // (1024 * 1024)})")
 
     args = parser.parse_args()
 
@@ -379,30 +903,36 @@ def main():
 
     MAX_PARALLEL_DOWNLOADS = args.max_parallel
     MAX_THREADS_PER_DOWNLOAD = args.threads
+    MAX_PROCESSES_PER_DOWNLOAD = args.processes
+    if args.skip_hash_check:
+        CHECK_HASHES = "never"
+    DOWNLOAD_CHUNK_SIZE = args.chunk_size * 1024 * 1024
 
-    # Check if gsutil is installed
-    if not check_gsutil_installed():
-        sys.exit(1)
+    # Install and import dependencies only once there is work to do
+    _ensure_deps()
 
-    # Try to optimize gsutil config
-    optimize_gsutil_config()
+    # Use one in-process storage client for every download in this run
+    client = create_storage_client()
+
+    # Fall back to gsutil when the storage client has no credentials
+    if client is None:
+        if not check_gsutil_installed():
+            sys.exit(1)
 
     # Run in interactive mode if specified or if no arguments are provided
     if args.interactive or len(sys.argv) == 1:
-        interactive_download()
+        interactive_download(client)
         return
 
     # Get destination directory
     destination = args.destination if args.destination else get_default_destination()
     destination = os.path.expanduser(destination)  # Expand ~ if present
 
-    if not os.path.exists(destination):
-        try:
-            os.makedirs(destination)
-            print(f"Created directory: {destination}")
-        except OSError as e:
-            print(f"Error creating destination directory: {e}")
-            sys.exit(1)
+    try:
+        os.makedirs(destination, exist_ok=True)
+    except OSError as e:
+        print(f"Error creating destination directory: {e}")
+        sys.exit(1)
 
     # Check if bucket is provided
     if not args.bucket:
@@ -422,7 +952,7 @@ def main():
         file_dest = os.path.join(destination, file_name)
 
         print(f"Downloading file {file_path} to {file_dest}")
-        success = download_with_progress(file_path, file_dest)
+        success = download_with_progress(file_path, file_dest, client=client)
 
         if success:
             print(f"Successfully downloaded {file_path}")
@@ -435,11 +965,10 @@ def main():
         folder_name = os.path.basename(args.folder.rstrip('/'))
         folder_dest = os.path.join(destination, folder_name)
 
-        if not os.path.exists(folder_dest):
-            os.makedirs(folder_dest)
+        os.makedirs(folder_dest, exist_ok=True)
 
         print(f"Downloading folder {folder_path} to {folder_dest}")
-        success = download_with_progress(folder_path, folder_dest)
+        success = download_with_progress(folder_path, folder_dest, client=client)
 
         if success:
             print(f"Successfully downloaded {folder_path}")
@@ -449,7 +978,7 @@ def main():
     # Download entire bucket
     else:
         print(f"Downloading entire bucket {bucket} to {destination}")
-        success = download_with_progress(bucket, destination)
+        success = download_with_progress(bucket, destination, client=client)
 
         if success:
             print(f"Successfully downloaded {bucket}")